@@ -9,15 +9,18 @@ Supports both Anthropic SDK (direct) and OpenRouter (via OpenAI SDK).
 
 Includes comprehensive logging of all agent activity.
 Logs are saved to: prompt_forge/logs/
+Batch results from optimize_many() are cached in: prompt_forge/cache/
 """
 
-import json
+import asyncio
+import hashlib
+import re
+import time
 from typing import Optional
-from datetime import datetime
-
-import sys
+from datetime import datetime, timedelta
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import orjson
 
 from llm import (
     create_llm_client,
@@ -35,7 +38,14 @@ from config import (
 )
 from models.schemas import OptimizedPrompt, PromptChange
 from utils.logger import FileLogger
-from agents.tools import OPTIMIZER_TOOLS, execute_tool
+from agents.tools import (
+    DOC_HEADER_PREFIX,
+    MIN_OPTIMIZED_PROMPT_LENGTH,
+    OPTIMIZER_TOOLS,
+    execute_tool_async,
+    prefetch_provider_doc,
+    provider_docs_version,
+)
 
 
 # =============================================================================
@@ -47,29 +57,36 @@ class AgentLog:
 
     def __init__(self, provider: str):
         self.provider = provider
-        self.entries = []
         self.start_time = datetime.now()
+        self._t0 = time.perf_counter_ns()
+        # Entries are stored column-wise; to_dict() zips them back into rows
+        self._elapsed_ns: list[int] = []
+        self._type: list[str] = []
+        self._content: list[str] = []
+        self._metadata: list[dict] = []
 
     def log(self, event_type: str, content: str, metadata: dict = None):
-        """Add a log entry."""
-        self.entries.append({
-            "timestamp": datetime.now().isoformat(),
-            "elapsed_ms": int((datetime.now() - self.start_time).total_seconds() * 1000),
-            "type": event_type,
-            "content": content[:500] if len(content) > 500 else content,
-            "full_content": content,
-            "metadata": metadata or {}
-        })
+        """
+        Add a log entry. Content is truncated; the full text goes to the FileLogger.
+        Timestamps are derived from a monotonic offset in to_dict().
+        """
+        self._elapsed_ns.append(time.perf_counter_ns() - self._t0)
+        self._type.append(event_type)
+        self._content.append(content[:500])
+        self._metadata.append(metadata or {})
 
     def to_dict(self) -> list:
-        """Return logs as list of dicts (without full_content for API response)."""
+        """Return logs as list of dicts for the API response."""
+        start_time = self.start_time
         return [{
-            "timestamp": e["timestamp"],
-            "elapsed_ms": e["elapsed_ms"],
-            "type": e["type"],
-            "content": e["content"],
-            "metadata": e["metadata"]
-        } for e in self.entries]
+            "timestamp": (start_time + timedelta(microseconds=ns // 1000)).isoformat(),
+            "elapsed_ms": ns // 1_000_000,
+            "type": event_type,
+            "content": content,
+            "metadata": metadata,
+        } for ns, event_type, content, metadata in zip(
+            self._elapsed_ns, self._type, self._content, self._metadata
+        )]
 
 
 # =============================================================================
@@ -95,6 +112,98 @@ AGENT_SYSTEM_PROMPT = """You are a prompt optimization expert. You have access t
 START by listing docs for the target provider."""
 
 
+# Task message sent at the start of each run; filled in by optimize()
+TASK_TEMPLATE = """## TASK: Optimize for {provider_upper}
+
+ORIGINAL PROMPT:
+```
+{prompt}
+```
+
+Length: {length} chars
+
+## STEPS
+1. Call list_provider_docs with provider={provider}
+2. Call read_provider_doc to read prompting.md
+3. Read and understand the guidelines
+4. Call submit_optimization with your result
+
+BEGIN NOW."""
+
+
+# Placeholder text the agent sometimes submits instead of a real prompt
+_PLACEHOLDER_RE = re.compile(
+    r"<optimized_prompt_here>|\[your prompt here\]|placeholder|insert your",
+    re.IGNORECASE,
+)
+
+
+# Agent loop states, following the workflow in the system prompt
+_AWAIT_LIST = "await_list"
+_AWAIT_READ = "await_read"
+_AWAIT_SUBMIT = "await_submit"
+
+# Nudge sent when the LLM stops without calling the tool its current state needs
+_NUDGES = {
+    _AWAIT_LIST: "Please use the list_provider_docs tool to see the available documentation.",
+    _AWAIT_READ: "Please use the read_provider_doc tool to read the prompting guidelines.",
+    _AWAIT_SUBMIT: "Please use the submit_optimization tool to submit your optimized prompt.",
+}
+
+
+# A reply that is nothing but one ``` fenced block, the format the task message uses
+_FENCED_REPLY_RE = re.compile(r"\A```[^\n`]*\n(.*?)\n?```\Z", re.DOTALL)
+
+
+def _fenced_prompt(text: str) -> Optional[str]:
+    """Return the prompt if the reply is a single fenced block, else None."""
+    match = _FENCED_REPLY_RE.match(text.strip())
+    if match is None or "```" in match.group(1):
+        return None
+    return match.group(1).strip() or None
+
+
+# =============================================================================
+# RESULT CACHE - Disk-backed, used by optimize_many()
+# =============================================================================
+
+CACHE_DIR = Path(__file__).parent.parent / "cache"
+
+
+# Changing the prompts or a tool schema changes agent behavior, so it invalidates cached results
+_AGENT_FINGERPRINT = hashlib.sha256(
+    "\0".join([AGENT_SYSTEM_PROMPT, TASK_TEMPLATE, *(t.fingerprint() for t in OPTIMIZER_TOOLS)]).encode()
+).hexdigest()
+
+
+def _cache_key(prompt: str, provider: str, model: str, docs_version: int) -> str:
+    """
+    Content hash identifying an optimization request.
+
+    `docs_version` (see provider_docs_version) ties the result to the docs
+    it was built from, so updated guidelines invalidate it.
+    """
+    return hashlib.sha256(
+        f"{prompt}\0{provider}\0{model}\0{_AGENT_FINGERPRINT}\0{docs_version}".encode()
+    ).hexdigest()
+
+
+def _load_cached(key: str) -> Optional[OptimizedPrompt]:
+    """Load a cached result, or None if missing or unreadable."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        return OptimizedPrompt.model_validate_json(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(key: str, result: OptimizedPrompt):
+    """Persist a successful result. Agent logs belong to the original run and are dropped."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    result = result.model_copy(update={"agent_logs": None})
+    (CACHE_DIR / f"{key}.json").write_text(result.model_dump_json())
+
+
 # =============================================================================
 # OPTIMIZER AGENT CLASS
 # =============================================================================
@@ -128,6 +237,10 @@ class OptimizerAgent:
         preserve_structure: bool = True,
     ) -> OptimizedPrompt:
         """Run agentic optimization with native tool calls."""
+        # The agent always reads prompting.md, so start loading it while the LLM decodes
+        prefetch = asyncio.create_task(
+            asyncio.to_thread(prefetch_provider_doc, provider, "prompting.md")
+        )
         log = AgentLog(provider)
         file_log = FileLogger(provider)
 
@@ -139,22 +252,12 @@ class OptimizerAgent:
             })
             file_log.log("system", f"Starting optimization for {provider.upper()}\nModel: {self.llm.model}\nLLM Provider: {self.llm.provider.value}\nOriginal prompt length: {len(prompt)} chars")
 
-            task = f"""## TASK: Optimize for {provider.upper()}
-
-ORIGINAL PROMPT:
-```
-{prompt}
-```
-
-Length: {len(prompt)} chars
-
-## STEPS
-1. Call list_provider_docs with provider={provider}
-2. Call read_provider_doc to read prompting.md
-3. Read and understand the guidelines
-4. Call submit_optimization with your result
-
-BEGIN NOW."""
+            task = TASK_TEMPLATE.format(
+                provider=provider,
+                provider_upper=provider.upper(),
+                prompt=prompt,
+                length=len(prompt),
+            )
 
             log.log("input", f"Task assigned to agent", {"task_length": len(task)})
             file_log.log("task_input", task)
@@ -193,6 +296,60 @@ BEGIN NOW."""
             result.agent_logs = log.to_dict()
             return result
 
+        finally:
+            prefetch.cancel()
+            # No-op if closed above; covers cancellation, which skips the except
+            file_log.close(success=False, result_summary="Cancelled")
+
+    async def optimize_many(
+        self,
+        requests: list[tuple[str, str]],
+        max_concurrency: int = 16,
+        preserve_structure: bool = True,
+    ) -> list[OptimizedPrompt]:
+        """
+        Optimize many (prompt, provider) pairs concurrently.
+
+        All runs share self.llm and therefore its connection pool. Identical
+        pairs are optimized once, and successful results are cached on disk
+        (until the provider's docs change) so repeated batches skip the agent
+        loop entirely. Cached results carry no agent_logs.
+
+        Args:
+            requests: (prompt, provider) pairs
+            max_concurrency: Maximum number of agent loops running at once
+
+        Returns:
+            Results in the same order as requests
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(key: str, prompt: str, provider: str) -> OptimizedPrompt:
+            cached = await asyncio.to_thread(_load_cached, key)
+            if cached is not None:
+                return cached
+            async with semaphore:
+                result = await self.optimize(prompt, provider, preserve_structure)
+            if result.success:
+                await asyncio.to_thread(_store_cached, key, result)
+            return result
+
+        providers = {provider for _, provider in requests}
+        docs_versions = await asyncio.to_thread(
+            lambda: {provider: provider_docs_version(provider) for provider in providers}
+        )
+        keys = [
+            _cache_key(prompt, provider, self.llm.model, docs_versions[provider])
+            for prompt, provider in requests
+        ]
+        unique = {}
+        for key, (prompt, provider) in zip(keys, requests):
+            if key not in unique:
+                unique[key] = run(key, prompt, provider)
+
+        results = dict(zip(unique, await asyncio.gather(*unique.values())))
+        return [results[key] for key in keys]
+
     async def _run_agent_loop(
         self,
         task: str,
@@ -209,6 +366,7 @@ BEGIN NOW."""
 
         docs_read = []
         max_iterations = 8
+        state = _AWAIT_LIST
 
         for iteration in range(max_iterations):
             log.log("llm_call", f"Iteration {iteration + 1}: Calling LLM", {"iteration": iteration + 1})
@@ -236,11 +394,9 @@ BEGIN NOW."""
                     tool_calls=response.tool_calls
                 ))
 
-                # Execute tools and collect results
-                tool_results = []
                 for tool_call in response.tool_calls:
                     log.log("tool_call", f"Calling: {tool_call.name}", tool_call.arguments)
-                    file_log.log("tool_call", f"Tool: {tool_call.name}\nArgs: {json.dumps(tool_call.arguments, indent=2)}")
+                    file_log.log("tool_call", lambda tc=tool_call: f"Tool: {tc.name}\nArgs: {orjson.dumps(tc.arguments, option=orjson.OPT_INDENT_2).decode()}")
 
                     # Check for submission
                     if tool_call.name == "submit_optimization":
@@ -252,17 +408,22 @@ BEGIN NOW."""
                             log
                         )
 
-                    # Execute other tools
-                    result = execute_tool(tool_call.name, tool_call.arguments)
+                # Execute other tools concurrently and collect results
+                results = await asyncio.gather(*[
+                    execute_tool_async(tool_call.name, tool_call.arguments)
+                    for tool_call in response.tool_calls
+                ])
 
+                tool_results = []
+                for tool_call, result in zip(response.tool_calls, results):
                     log.log("tool_result", result[:300] + "..." if len(result) > 300 else result, {
                         "tool": tool_call.name,
                         "result_length": len(result)
                     })
                     file_log.log("tool_result", f"Tool: {tool_call.name}\nResult ({len(result)} chars):\n{result}")
 
-                    # Track docs read
-                    if tool_call.name == "read_provider_doc":
+                    # Track docs read; failed reads (e.g. unknown doc) don't count
+                    if tool_call.name == "read_provider_doc" and result.startswith(DOC_HEADER_PREFIX):
                         doc_key = f"{tool_call.arguments.get('provider', '')}/{tool_call.arguments.get('doc_name', '')}"
                         docs_read.append(doc_key)
 
@@ -274,14 +435,33 @@ BEGIN NOW."""
                 # Add tool results
                 messages.append(Message.tool_result(tool_results))
 
+                # Advance the workflow state
+                if docs_read:
+                    state = _AWAIT_SUBMIT
+                elif state == _AWAIT_LIST and any(
+                    tool_call.name == "list_provider_docs" for tool_call in response.tool_calls
+                ):
+                    state = _AWAIT_READ
+
             # Check if conversation ended without tool call
             elif response.stop_reason in ("end_turn", "stop"):
-                log.log("warning", "LLM ended without submitting - prompting to use tools")
-                file_log.log("warning", f"LLM ended with stop_reason={response.stop_reason} without tool call")
+                # Docs are read and the reply is just the fenced prompt: submit it without another round-trip
+                fenced = _fenced_prompt(response.content) if state == _AWAIT_SUBMIT else None
+                if fenced is not None:
+                    log.log("warning", "LLM answered with a fenced prompt instead of submitting - using it as the submission")
+                    file_log.log("warning", f"LLM ended with stop_reason={response.stop_reason}; treating fenced block as submission")
+                    return self._handle_submission(
+                        {"optimized_prompt": fenced},
+                        provider,
+                        original,
+                        docs_read,
+                        log
+                    )
+
+                log.log("warning", f"LLM ended without a tool call ({state}) - prompting to use tools")
+                file_log.log("warning", f"LLM ended with stop_reason={response.stop_reason} without tool call (state={state})")
                 messages.append(Message.assistant(content=response.content))
-                messages.append(Message.user(
-                    "Please use the submit_optimization tool to submit your optimized prompt."
-                ))
+                messages.append(Message.user(_NUDGES[state]))
 
         # Max iterations reached
         log.log("error", "Max iterations reached without completion")
@@ -306,7 +486,7 @@ BEGIN NOW."""
         changes_data = args.get("changes", [])
 
         # Validate submission
-        if not optimized or len(optimized) < 15:
+        if not optimized or len(optimized) < MIN_OPTIMIZED_PROMPT_LENGTH:
             log.log("parse_error", "Empty or too short optimized prompt")
             return OptimizedPrompt(
                 provider=provider,
@@ -317,23 +497,16 @@ BEGIN NOW."""
             )
 
         # Check for placeholder patterns
-        invalid_patterns = [
-            "<optimized_prompt_here>",
-            "[your prompt here]",
-            "placeholder",
-            "insert your",
-        ]
-        optimized_lower = optimized.lower().strip()
-        for pattern in invalid_patterns:
-            if pattern in optimized_lower:
-                log.log("parse_error", f"Placeholder detected: {pattern}")
-                return OptimizedPrompt(
-                    provider=provider,
-                    prompt=original,
-                    changes=[PromptChange(category="error", description="Agent submitted placeholder")],
-                    success=False,
-                    error="Placeholder output detected",
-                )
+        match = _PLACEHOLDER_RE.search(optimized)
+        if match:
+            log.log("parse_error", f"Placeholder detected: {match.group(0)}")
+            return OptimizedPrompt(
+                provider=provider,
+                prompt=original,
+                changes=[PromptChange(category="error", description="Agent submitted placeholder")],
+                success=False,
+                error="Placeholder output detected",
+            )
 
         # Parse changes
         changes = []
@@ -1,13 +1,18 @@
 """Tool definitions and execution for the optimizer agent."""
 
+import asyncio
+import functools
+import mmap
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import DOCS_BASE_PATH, SUPPORTED_PROVIDERS
 from llm import ToolDefinition, ToolParameter
 
+_DOCS_ROOT = Path(DOCS_BASE_PATH)
+
+# Submissions shorter than this are rejected; enforced in the tool schema and in the agent
+MIN_OPTIMIZED_PROMPT_LENGTH = 15
+
 
 # =============================================================================
 # Tool Definitions (for LLM)
@@ -48,7 +53,12 @@ OPTIMIZER_TOOLS = [
             ToolParameter(
                 name="optimized_prompt",
                 type="string",
-                description="The complete optimized prompt text"
+                description="The complete optimized prompt text",
+                # Lets providers that enforce JSON Schema reject placeholders before dispatch
+                constraints={
+                    "minLength": MIN_OPTIMIZED_PROMPT_LENGTH,
+                    "pattern": r"^(?![\s\S]*<optimized_prompt_here>)",
+                }
             ),
             ToolParameter(
                 name="changes",
@@ -71,19 +81,89 @@ OPTIMIZER_TOOLS = [
 # Tool Implementations
 # =============================================================================
 
+MAX_DOC_CHARS = 12000
+
+# Every successful read_provider_doc result starts with this; error messages don't
+DOC_HEADER_PREFIX = "=== "
+
+# Docs larger than this are memory-mapped so only the head that survives truncation is decoded
+_MMAP_THRESHOLD = 64 * 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _doc_files(provider: str, mtime_ns: int) -> tuple[str, ...]:
+    """Sorted markdown filenames for a provider. `mtime_ns` keys the cache to the directory state."""
+    provider_path = _DOCS_ROOT / provider
+    return tuple(sorted(f.name for f in provider_path.iterdir() if f.suffix == ".md"))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_doc(provider: str, doc_name: str, mtime_ns: int) -> str:
+    """Read, truncate and format a doc. `mtime_ns` keys the cache to the file version."""
+    doc_path = _DOCS_ROOT / provider / doc_name
+
+    if doc_path.stat().st_size > _MMAP_THRESHOLD:
+        # At most 4 bytes per UTF-8 char, so this head always holds MAX_DOC_CHARS chars
+        with open(doc_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = mm[:MAX_DOC_CHARS * 4].decode("utf-8", errors="ignore")
+    else:
+        content = doc_path.read_text()
+
+    if len(content) > MAX_DOC_CHARS:
+        content = content[:MAX_DOC_CHARS] + "\n\n[Truncated - apply the patterns you've learned]"
+
+    return f"{DOC_HEADER_PREFIX}{provider.upper()}: {doc_name} ===\n\n{content}"
+
+
+def prefetch_provider_doc(provider: str, doc_name: str) -> None:
+    """Warm the doc cache ahead of the agent asking for it. Missing docs are ignored."""
+    provider = provider.lower()
+    try:
+        mtime_ns = (_DOCS_ROOT / provider / doc_name).stat().st_mtime_ns
+        _load_doc(provider, doc_name, mtime_ns)
+    except OSError:
+        pass
+
+
+def provider_docs_version(provider: str) -> int:
+    """
+    Latest mtime across a provider's docs directory and its markdown files.
+
+    Changes whenever a doc is added, removed or rewritten in place. Returns
+    0 for an unknown provider.
+    """
+    provider_lower = provider.lower()
+    provider_path = _DOCS_ROOT / provider_lower
+    try:
+        dir_mtime = provider_path.stat().st_mtime_ns
+        return max([
+            dir_mtime,
+            *((provider_path / name).stat().st_mtime_ns for name in _doc_files(provider_lower, dir_mtime)),
+        ])
+    except OSError:
+        return 0
+
+
 def list_provider_docs(provider: str) -> str:
     """List available documentation files for a provider."""
-    provider_path = Path(DOCS_BASE_PATH) / provider.lower()
+    provider_lower = provider.lower()
+    provider_path = _DOCS_ROOT / provider_lower
 
     if not provider_path.exists():
         return f"Error: Provider '{provider}' not found. Available providers: {SUPPORTED_PROVIDERS}"
 
-    files = [f.name for f in provider_path.iterdir() if f.suffix == ".md"]
+    return _list_provider_docs_cached(provider_lower, provider_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _list_provider_docs_cached(provider: str, mtime_ns: int) -> str:
+    """Formatted list_provider_docs response. `mtime_ns` keys the cache to the directory state."""
+    files = _doc_files(provider, mtime_ns)
 
     if not files:
         return f"No documentation found for '{provider}'."
 
-    return f"Available docs for {provider.upper()}: {', '.join(sorted(files))}. Call read_provider_doc to read them."
+    return f"Available docs for {provider.upper()}: {', '.join(files)}. Call read_provider_doc to read them."
 
 
 def read_provider_doc(provider: str, doc_name: str) -> str:
@@ -91,20 +171,17 @@ def read_provider_doc(provider: str, doc_name: str) -> str:
     if not doc_name.endswith(".md"):
         doc_name = f"{doc_name}.md"
 
-    doc_path = Path(DOCS_BASE_PATH) / provider.lower() / doc_name
+    provider_lower = provider.lower()
+    provider_path = _DOCS_ROOT / provider_lower
+    doc_path = provider_path / doc_name
 
     if not doc_path.exists():
-        provider_path = Path(DOCS_BASE_PATH) / provider.lower()
         if provider_path.exists():
-            available = [f.name for f in provider_path.iterdir() if f.suffix == ".md"]
+            available = list(_doc_files(provider_lower, provider_path.stat().st_mtime_ns))
             return f"Document '{doc_name}' not found. Available files: {available}"
         return f"Provider '{provider}' not found. Available: {SUPPORTED_PROVIDERS}"
 
-    content = doc_path.read_text()
-    if len(content) > 12000:
-        content = content[:12000] + "\n\n[Truncated - apply the patterns you've learned]"
-
-    return f"=== {provider.upper()}: {doc_name} ===\n\n{content}"
+    return _load_doc(provider_lower, doc_name, doc_path.stat().st_mtime_ns)
 
 
 def execute_tool(name: str, args: dict) -> str:
@@ -120,3 +197,14 @@ def execute_tool(name: str, args: dict) -> str:
         # submit_optimization is handled specially in the agent loop
         return "SUBMIT"
     return f"Unknown tool: {name}"
+
+
+# Tools that touch the filesystem; these run in a worker thread
+_BLOCKING_TOOLS = {"list_provider_docs", "read_provider_doc"}
+
+
+async def execute_tool_async(name: str, args: dict) -> str:
+    """Execute a tool without blocking the event loop on file I/O."""
+    if name in _BLOCKING_TOOLS:
+        return await asyncio.to_thread(execute_tool, name, args)
+    return execute_tool(name, args)
@@ -1,6 +1,8 @@
 """Configuration for LLM providers and application settings."""
 
+import json
 import os
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -37,6 +39,9 @@ DEFAULT_MAX_TOKENS = int(os.getenv("DEFAULT_MAX_TOKENS", "16384"))
 # Application settings
 DOCS_BASE_PATH = os.path.join(os.path.dirname(__file__), "docs")
 
+# Snapshot of the provider scan, reused while docs/ is unchanged
+PROVIDERS_CACHE_PATH = os.path.join(os.path.dirname(__file__), ".providers.cache")
+
 
 def get_llm_provider() -> str:
     """Get the configured LLM provider."""
@@ -79,17 +84,67 @@ def get_supported_providers() -> list[str]:
     """
     Dynamically detect supported providers by scanning the docs folder.
     Each subfolder in docs/ that contains at least one .md file is a provider.
+
+    The result is snapshotted to PROVIDERS_CACHE_PATH keyed by the mtimes
+    of docs/ and each of its subfolders, so later imports (e.g. each server
+    worker) need one stat per folder. Adding or removing a provider folder
+    changes the docs/ mtime; adding or removing .md files changes the
+    subfolder's.
     """
+    try:
+        state = _docs_state()
+    except OSError:
+        return []
+
+    try:
+        with open(PROVIDERS_CACHE_PATH) as f:
+            cached = json.load(f)
+        if cached["state"] == state:
+            return cached["providers"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    providers = _scan_providers()
+
+    # Write atomically so concurrent workers never read a partial snapshot
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(PROVIDERS_CACHE_PATH), prefix=".providers.cache.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"state": state, "providers": providers}, f)
+            os.replace(tmp_path, PROVIDERS_CACHE_PATH)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+    return providers
+
+
+def _docs_state() -> list:
+    """docs/ mtime followed by [name, mtime] for each subfolder, in name order."""
+    docs_mtime = os.stat(DOCS_BASE_PATH).st_mtime_ns
+    with os.scandir(DOCS_BASE_PATH) as entries:
+        subdirs = sorted(
+            [entry.name, entry.stat().st_mtime_ns] for entry in entries if entry.is_dir()
+        )
+    return [docs_mtime, subdirs]
+
+
+def _scan_providers() -> list[str]:
+    """Walk docs/ for subfolders containing markdown files."""
     docs_path = Path(DOCS_BASE_PATH)
     providers = []
 
-    if docs_path.exists():
-        for item in docs_path.iterdir():
-            if item.is_dir():
-                # Check if folder has at least one markdown file
-                md_files = list(item.glob("*.md"))
-                if md_files:
-                    providers.append(item.name)
+    for item in docs_path.iterdir():
+        if item.is_dir():
+            # Check if folder has at least one markdown file
+            md_files = list(item.glob("*.md"))
+            if md_files:
+                providers.append(item.name)
 
     return sorted(providers)
 
@@ -6,7 +6,7 @@ from .base import BaseLLMClient, LLMProvider, LLMResponse
 from .anthropic_client import AnthropicClient
 from .openrouter_client import OpenRouterClient
 from .dashscope_client import DashScopeClient
-from .message_types import Message, ToolCall, ToolResult
+from .message_types import Message, Role, ToolCall, ToolResult
 from .tool_types import ToolDefinition, ToolParameter
 
 
@@ -64,6 +64,7 @@ __all__ = [
     "DashScopeClient",
     # Message types
     "Message",
+    "Role",
     "ToolCall",
     "ToolResult",
     # Tool types
@@ -5,10 +5,29 @@ from typing import Optional
 import anthropic
 
 from .base import BaseLLMClient, LLMResponse, LLMProvider
-from .message_types import Message, ToolCall
+from .http_client import get_shared_http_client
+from .message_types import Message, Role, ToolCall
 from .tool_types import ToolDefinition
 
 
+# Prompt caching: Anthropic allows four cache breakpoints per request. The tool
+# list and system prompt take one each; large tool results (e.g. provider docs)
+# may take up to two.
+_CACHE_CONTROL = {"type": "ephemeral"}
+_MAX_TOOL_RESULT_BREAKPOINTS = 2
+# ~1024 tokens, the minimum cacheable prefix length
+_CACHEABLE_TOOL_RESULT_CHARS = 4096
+
+
+def _to_anthropic_tools(tools: list[ToolDefinition]) -> list[dict]:
+    # A breakpoint on the last tool caches the whole tool list
+    last = len(tools) - 1
+    return [
+        t.to_anthropic_format(_CACHE_CONTROL if i == last else None)
+        for i, t in enumerate(tools)
+    ]
+
+
 class AnthropicClient(BaseLLMClient):
     """Client for Anthropic's Claude API using native SDK."""
 
@@ -20,7 +39,10 @@ class AnthropicClient(BaseLLMClient):
         max_tokens: int = 16384,
     ):
         super().__init__(model, temperature, max_tokens)
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=get_shared_http_client(),
+        )
 
     @property
     def provider(self) -> LLMProvider:
@@ -31,6 +53,7 @@ class AnthropicClient(BaseLLMClient):
         messages: list[Message],
         system: Optional[str] = None,
         tools: Optional[list[ToolDefinition]] = None,
+        selected_tools: Optional[set[str]] = None,
     ) -> LLMResponse:
         """Send chat completion to Anthropic."""
         # Convert messages to Anthropic format
@@ -44,10 +67,18 @@ class AnthropicClient(BaseLLMClient):
         }
 
         if system:
-            request_kwargs["system"] = system
+            request_kwargs["system"] = [
+                {"type": "text", "text": system, "cache_control": _CACHE_CONTROL}
+            ]
 
         if tools:
-            request_kwargs["tools"] = [t.to_anthropic_format() for t in tools]
+            if selected_tools is None:
+                request_kwargs["tools"] = self._convert_tools(tools, _to_anthropic_tools)
+            else:
+                request_kwargs["tools"] = [
+                    t.to_anthropic_format() if t.name in selected_tools else t.to_anthropic_summary()
+                    for t in tools
+                ]
 
         # Make API call
         response = await self.client.messages.create(**request_kwargs)
@@ -56,44 +87,86 @@ class AnthropicClient(BaseLLMClient):
         return self._parse_response(response)
 
     def _convert_messages(self, messages: list[Message]) -> list[dict]:
-        """Convert unified messages to Anthropic format."""
+        """Convert unified messages to Anthropic format, reusing each message's cached conversion."""
         result = []
-
+        breakpoints = 0
         for msg in messages:
-            if msg.role == "user":
-                result.append({"role": "user", "content": msg.content})
-
-            elif msg.role == "assistant":
-                content = []
-                if msg.content:
-                    content.append({"type": "text", "text": msg.content})
-                for tc in msg.tool_calls:
-                    content.append({
-                        "type": "tool_use",
-                        "id": tc.id,
-                        "name": tc.name,
-                        "input": tc.arguments,
-                    })
-                # If no content, add empty text to avoid API error
-                if not content:
-                    content.append({"type": "text", "text": ""})
-                result.append({"role": "assistant", "content": content})
-
-            elif msg.role == "tool_result":
-                content = []
-                for tr in msg.tool_results:
-                    item = {
-                        "type": "tool_result",
-                        "tool_use_id": tr.tool_call_id,
-                        "content": tr.content,
-                    }
-                    if tr.is_error:
-                        item["is_error"] = True
-                    content.append(item)
-                result.append({"role": "user", "content": content})
-
+            converted = msg._anthropic_cache
+            if converted is None:
+                converted = self._convert_message(msg)
+                msg._anthropic_cache = converted
+            if not converted:
+                continue
+            if msg.role is Role.TOOL_RESULT and breakpoints < _MAX_TOOL_RESULT_BREAKPOINTS:
+                converted, breakpoints = self._add_breakpoints(converted, breakpoints)
+            result.append(converted)
         return result
 
+    def _add_breakpoints(self, converted: dict, breakpoints: int) -> tuple[dict, int]:
+        """
+        Mark large tool results in a converted message as cacheable.
+
+        Large results are re-sent every iteration, so caching them pays off.
+        Returns a copy if anything changed (the cached dict is left as is)
+        and the updated count of cache breakpoints.
+        """
+        content = None
+        for i, item in enumerate(converted["content"]):
+            if breakpoints >= _MAX_TOOL_RESULT_BREAKPOINTS:
+                break
+            if len(item["content"]) > _CACHEABLE_TOOL_RESULT_CHARS:
+                if content is None:
+                    content = list(converted["content"])
+                content[i] = {
+                    **item,
+                    "content": [{"type": "text", "text": item["content"], "cache_control": _CACHE_CONTROL}],
+                }
+                breakpoints += 1
+        if content is None:
+            return converted, breakpoints
+        return {"role": "user", "content": content}, breakpoints
+
+    def _convert_message(self, msg: Message) -> dict:
+        """
+        Convert a single unified message to Anthropic format.
+
+        Returns an empty dict if the message should be omitted.
+        """
+        if msg.role is Role.USER:
+            return {"role": "user", "content": msg.content}
+
+        elif msg.role is Role.ASSISTANT:
+            content = []
+            if msg.content:
+                content.append({"type": "text", "text": msg.content})
+            for tc in msg.tool_calls:
+                content.append({
+                    "type": "tool_use",
+                    "id": tc.id,
+                    "name": tc.name,
+                    "input": tc.arguments,
+                })
+            # The API rejects empty text blocks; omit the turn instead and
+            # let the API merge the surrounding user turns
+            if not content:
+                return {}
+            return {"role": "assistant", "content": content}
+
+        elif msg.role is Role.TOOL_RESULT:
+            content = []
+            for tr in msg.tool_results:
+                item = {
+                    "type": "tool_result",
+                    "tool_use_id": tr.tool_call_id,
+                    "content": tr.content,
+                }
+                if tr.is_error:
+                    item["is_error"] = True
+                content.append(item)
+            return {"role": "user", "content": content}
+
+        raise ValueError(f"Unknown message role: {msg.role}")
+
     def _parse_response(self, response) -> LLMResponse:
         """Parse Anthropic response to unified format."""
         content = ""
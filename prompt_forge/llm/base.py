@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 from .message_types import Message, ToolCall
 from .tool_types import ToolDefinition
@@ -16,7 +16,7 @@ class LLMProvider(str, Enum):
     DASHSCOPE = "dashscope"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Unified response from LLM."""
     content: str
@@ -37,6 +37,25 @@ class BaseLLMClient(ABC):
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        # Last tools list passed to chat() and its provider-format conversion
+        self._tools_cache: tuple[list[ToolDefinition], list[dict]] | None = None
+
+    def _convert_tools(
+        self,
+        tools: list[ToolDefinition],
+        convert: Callable[[list[ToolDefinition]], list[dict]],
+    ) -> list[dict]:
+        """
+        Convert tools to provider format, reusing the previous result.
+
+        Agents pass the same tools list on every turn, so the conversion is
+        keyed on the list's identity. Tool lists must not be mutated in place.
+        """
+        cached = self._tools_cache
+        if cached is None or cached[0] is not tools:
+            cached = (tools, convert(tools))
+            self._tools_cache = cached
+        return cached[1]
 
     @abstractmethod
     async def chat(
@@ -44,6 +63,7 @@ class BaseLLMClient(ABC):
         messages: list[Message],
         system: Optional[str] = None,
         tools: Optional[list[ToolDefinition]] = None,
+        selected_tools: Optional[set[str]] = None,
     ) -> LLMResponse:
         """Send a chat completion request.
 
@@ -51,6 +71,8 @@ class BaseLLMClient(ABC):
             messages: Conversation history
             system: System prompt
             tools: Available tools for the LLM to call
+            selected_tools: Names of tools to send with their full schema; the
+                rest are sent as name-and-summary stubs. None sends every schema.
 
         Returns:
             LLMResponse with content and any tool calls
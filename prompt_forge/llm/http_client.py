@@ -0,0 +1,35 @@
+"""Shared HTTP connection pool for all LLM clients."""
+
+from typing import Optional
+
+import httpx
+
+# Pool sizing for bursts of concurrent agent loops
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+# httpx drops idle connections after 5s by default, shorter than a typical LLM
+# turn, which would force a fresh TLS handshake on every agent iteration
+KEEPALIVE_EXPIRY = 60.0
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide async HTTP client used by every LLM client.
+
+    Sharing one pool means agents created per request reuse warm TLS
+    connections, and HTTP/2 multiplexes concurrent calls over them.
+    Timeouts are left at httpx defaults so each SDK applies its own.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _shared_client
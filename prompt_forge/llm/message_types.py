@@ -1,10 +1,18 @@
 """Unified message types for all LLM providers."""
 
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from enum import IntEnum
+from typing import Any
 
 
-@dataclass
+class Role(IntEnum):
+    """Message roles. Integer-valued so converters can dispatch on them cheaply."""
+    USER = 0
+    ASSISTANT = 1
+    TOOL_RESULT = 2
+
+
+@dataclass(slots=True)
 class ToolCall:
     """A tool call from the LLM."""
     id: str
@@ -12,7 +20,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result of executing a tool."""
     tool_call_id: str
@@ -20,25 +28,39 @@ class ToolResult:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Unified message format for LLM conversations."""
-    role: Literal["user", "assistant", "tool_result"]
+    role: Role
     content: str = ""
     tool_calls: list[ToolCall] = field(default_factory=list)
     tool_results: list[ToolResult] = field(default_factory=list)
+    # OpenAI-format dicts, filled on first conversion. Messages are treated as
+    # immutable once sent, so later turns reuse them instead of rebuilding.
+    _openai_cache: list[dict] | None = field(default=None, init=False, repr=False, compare=False)
+    # Anthropic-format dict without cache breakpoints; empty if the message is omitted
+    _anthropic_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept role names ("user") and values; reject anything else up front
+        # rather than failing later in a provider's converter
+        if self.role.__class__ is not Role:
+            try:
+                self.role = Role[self.role.upper()] if isinstance(self.role, str) else Role(self.role)
+            except (KeyError, ValueError):
+                raise ValueError(f"Unknown message role: {self.role!r}") from None
 
     @classmethod
     def user(cls, content: str) -> "Message":
         """Create a user message."""
-        return cls(role="user", content=content)
+        return cls(role=Role.USER, content=content)
 
     @classmethod
     def assistant(cls, content: str, tool_calls: list[ToolCall] | None = None) -> "Message":
         """Create an assistant message."""
-        return cls(role="assistant", content=content, tool_calls=tool_calls or [])
+        return cls(role=Role.ASSISTANT, content=content, tool_calls=tool_calls or [])
 
     @classmethod
     def tool_result(cls, results: list[ToolResult]) -> "Message":
         """Create a tool result message."""
-        return cls(role="tool_result", tool_results=results)
+        return cls(role=Role.TOOL_RESULT, tool_results=results)
@@ -0,0 +1,141 @@
+"""Conversion to and from the OpenAI chat completions format, shared by OpenAI-compatible clients."""
+
+import functools
+from typing import Optional
+
+import orjson
+
+from .base import LLMResponse
+from .message_types import Message, Role, ToolCall
+from .tool_types import ToolDefinition
+
+
+def to_openai_tools(tools: list[ToolDefinition]) -> list[dict]:
+    return [t.to_openai_format() for t in tools]
+
+
+def _convert_user(msg: Message) -> list[dict]:
+    return [{"role": "user", "content": msg.content}]
+
+
+def _convert_assistant(msg: Message) -> list[dict]:
+    # Literal dicts with known keys rather than incremental inserts
+    if not msg.tool_calls:
+        return [{"role": "assistant", "content": msg.content}]
+    return [{
+        "role": "assistant",
+        "content": msg.content or None,
+        "tool_calls": [
+            {
+                "id": tc.id,
+                "type": "function",
+                "function": {
+                    "name": tc.name,
+                    "arguments": orjson.dumps(tc.arguments).decode(),
+                }
+            }
+            for tc in msg.tool_calls
+        ],
+    }]
+
+
+def _convert_tool_result(msg: Message) -> list[dict]:
+    return [
+        {
+            "role": "tool",
+            "tool_call_id": tr.tool_call_id,
+            "content": tr.content,
+        }
+        for tr in msg.tool_results
+    ]
+
+
+# Message converters keyed by role
+_CONVERTERS = {
+    Role.USER: _convert_user,
+    Role.ASSISTANT: _convert_assistant,
+    Role.TOOL_RESULT: _convert_tool_result,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _system_message(system: str) -> dict:
+    # Agents send the same system prompt every turn
+    return {"role": "system", "content": system}
+
+
+def convert_messages(messages: list[Message], system: Optional[str]) -> list[dict]:
+    """Convert unified messages to OpenAI format, reusing each message's cached conversion."""
+    # Size the result up front: tool results expand to one dict each
+    n = (1 if system else 0) + sum(
+        len(msg.tool_results) if msg.role is Role.TOOL_RESULT else 1 for msg in messages
+    )
+    result = [None] * n
+    idx = 0
+
+    # Add system message first
+    if system:
+        result[0] = _system_message(system)
+        idx = 1
+
+    for msg in messages:
+        converted = msg._openai_cache
+        if converted is None:
+            converted = _CONVERTERS[msg.role](msg)
+            msg._openai_cache = converted
+        k = len(converted)
+        result[idx:idx + k] = converted
+        idx += k
+
+    return result
+
+
+def parse_response(response) -> LLMResponse:
+    """Parse an OpenAI SDK response to unified format."""
+    choice = response.choices[0]
+    message = choice.message
+
+    if message.tool_calls:
+        _ToolCall, _loads = ToolCall, orjson.loads
+        tool_calls = [
+            _ToolCall(id=tc.id, name=tc.function.name, arguments=_loads(tc.function.arguments))
+            for tc in message.tool_calls
+        ]
+    else:
+        tool_calls = []
+
+    return LLMResponse(
+        content=message.content or "",
+        tool_calls=tool_calls,
+        stop_reason=choice.finish_reason,
+        usage={
+            "input_tokens": response.usage.prompt_tokens,
+            "output_tokens": response.usage.completion_tokens,
+        } if response.usage else None
+    )
+
+
+def parse_response_json(data: dict) -> LLMResponse:
+    """Parse a raw chat completions JSON body to unified format."""
+    choice = data["choices"][0]
+    message = choice["message"]
+
+    if message.get("tool_calls"):
+        _ToolCall, _loads = ToolCall, orjson.loads
+        tool_calls = [
+            _ToolCall(id=tc["id"], name=tc["function"]["name"], arguments=_loads(tc["function"]["arguments"]))
+            for tc in message["tool_calls"]
+        ]
+    else:
+        tool_calls = []
+
+    usage = data.get("usage")
+    return LLMResponse(
+        content=message.get("content") or "",
+        tool_calls=tool_calls,
+        stop_reason=choice.get("finish_reason"),
+        usage={
+            "input_tokens": usage["prompt_tokens"],
+            "output_tokens": usage["completion_tokens"],
+        } if usage else None
+    )
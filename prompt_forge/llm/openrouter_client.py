@@ -1,15 +1,52 @@
 """OpenRouter (OpenAI-compatible) client implementation."""
 
-import json
+import asyncio
+import random
 from typing import Optional
 
+import httpx
+import openai
+import orjson
 from openai import AsyncOpenAI
 
 from .base import BaseLLMClient, LLMResponse, LLMProvider
-from .message_types import Message, ToolCall
+from .http_client import get_shared_http_client
+from .message_types import Message
+from .openai_format import convert_messages, parse_response, parse_response_json, to_openai_tools
 from .tool_types import ToolDefinition
 
 
+# SDK error types for fast-path HTTP error statuses
+_STATUS_ERRORS = {
+    400: openai.BadRequestError,
+    401: openai.AuthenticationError,
+    403: openai.PermissionDeniedError,
+    404: openai.NotFoundError,
+    409: openai.ConflictError,
+    422: openai.UnprocessableEntityError,
+    429: openai.RateLimitError,
+}
+
+# Retry policy for the fast path, mirroring the SDK's
+_RETRY_STATUSES = {408, 409, 429}  # and all 5xx
+_INITIAL_RETRY_DELAY = 0.5
+_MAX_RETRY_DELAY = 8.0
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Seconds to wait before retry `attempt + 1`, honoring a short Retry-After."""
+    if response is not None:
+        try:
+            retry_after = float(response.headers.get("retry-after", ""))
+        except ValueError:
+            retry_after = 0
+        if 0 < retry_after <= 60:
+            return retry_after
+    delay = min(_INITIAL_RETRY_DELAY * 2 ** attempt, _MAX_RETRY_DELAY)
+    # Up to 25% jitter so concurrent agent loops don't retry in lockstep
+    return delay * (1 - 0.25 * random.random())
+
+
 class OpenRouterClient(BaseLLMClient):
     """Client for OpenRouter's OpenAI-compatible API."""
 
@@ -20,12 +57,28 @@ class OpenRouterClient(BaseLLMClient):
         temperature: float = 0.3,
         max_tokens: int = 16384,
         base_url: str = "https://openrouter.ai/api/v1",
+        fast_path: bool = True,
     ):
         super().__init__(model, temperature, max_tokens)
         self.client = AsyncOpenAI(
             api_key=api_key,
             base_url=base_url,
+            http_client=get_shared_http_client(),
         )
+        self._create = self.client.chat.completions.create
+        # Fixed request fields, copied per call
+        self._kwargs_template = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }
+        # Direct HTTP path that skips the SDK's request/response model validation
+        self.fast_path = fast_path
+        self._completions_url = f"{base_url.rstrip('/')}/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
 
     @property
     def provider(self) -> LLMProvider:
@@ -36,93 +89,104 @@ class OpenRouterClient(BaseLLMClient):
         messages: list[Message],
         system: Optional[str] = None,
         tools: Optional[list[ToolDefinition]] = None,
+        selected_tools: Optional[set[str]] = None,
     ) -> LLMResponse:
         """Send chat completion to OpenRouter."""
         # Convert messages to OpenAI format
-        openai_messages = self._convert_messages(messages, system)
+        openai_messages = convert_messages(messages, system)
 
         # Build request
-        request_kwargs = {
-            "model": self.model,
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "messages": openai_messages,
-        }
+        request_kwargs = self._kwargs_template.copy()
+        request_kwargs["messages"] = openai_messages
 
         if tools:
-            request_kwargs["tools"] = [t.to_openai_format() for t in tools]
+            if selected_tools is None:
+                request_kwargs["tools"] = self._convert_tools(tools, to_openai_tools)
+            else:
+                request_kwargs["tools"] = [
+                    t.to_openai_format() if t.name in selected_tools else t.to_openai_summary()
+                    for t in tools
+                ]
             request_kwargs["tool_choice"] = "auto"
 
+        if self.fast_path:
+            fast_response = await self._chat_fast(request_kwargs)
+            if fast_response is not None:
+                return fast_response
+
         # Make API call
-        response = await self.client.chat.completions.create(**request_kwargs)
+        response = await self._create(**request_kwargs)
 
         # Parse response
-        return self._parse_response(response)
-
-    def _convert_messages(
-        self,
-        messages: list[Message],
-        system: Optional[str]
-    ) -> list[dict]:
-        """Convert unified messages to OpenAI format."""
-        result = []
-
-        # Add system message first
-        if system:
-            result.append({"role": "system", "content": system})
-
-        for msg in messages:
-            if msg.role == "user":
-                result.append({"role": "user", "content": msg.content})
-
-            elif msg.role == "assistant":
-                msg_dict = {"role": "assistant"}
-                if msg.content:
-                    msg_dict["content"] = msg.content
-                if msg.tool_calls:
-                    msg_dict["tool_calls"] = [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": json.dumps(tc.arguments),
-                            }
-                        }
-                        for tc in msg.tool_calls
-                    ]
-                result.append(msg_dict)
-
-            elif msg.role == "tool_result":
-                for tr in msg.tool_results:
-                    result.append({
-                        "role": "tool",
-                        "tool_call_id": tr.tool_call_id,
-                        "content": tr.content,
-                    })
-
-        return result
-
-    def _parse_response(self, response) -> LLMResponse:
-        """Parse OpenAI response to unified format."""
-        choice = response.choices[0]
-        message = choice.message
-
-        tool_calls = []
-        if message.tool_calls:
-            for tc in message.tool_calls:
-                tool_calls.append(ToolCall(
-                    id=tc.id,
-                    name=tc.function.name,
-                    arguments=json.loads(tc.function.arguments),
-                ))
-
-        return LLMResponse(
-            content=message.content or "",
-            tool_calls=tool_calls,
-            stop_reason=choice.finish_reason,
-            usage={
-                "input_tokens": response.usage.prompt_tokens,
-                "output_tokens": response.usage.completion_tokens,
-            } if response.usage else None
-        )
+        return parse_response(response)
+
+    async def _chat_fast(self, request_kwargs: dict) -> Optional[LLMResponse]:
+        """
+        POST the request directly and parse the raw JSON.
+
+        Returns None only if the first attempt never reached the server
+        (connect failure or pool timeout), so the caller can safely fall back
+        to the SDK. Timeouts, connection errors and 408/409/429/5xx responses
+        are retried up to the SDK's max_retries with the same backoff; other
+        failures raise the SDK's typed error.
+        """
+        content = orjson.dumps(request_kwargs)
+        max_retries = self.client.max_retries
+
+        for attempt in range(max_retries + 1):
+            retries_left = max_retries - attempt
+            try:
+                response = await get_shared_http_client().post(
+                    self._completions_url,
+                    content=content,
+                    headers=self._headers,
+                    timeout=self.client.timeout,
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                if attempt == 0:
+                    return None
+                if not retries_left:
+                    raise openai.APIConnectionError(request=e.request) from e
+            except httpx.TimeoutException as e:
+                if not retries_left:
+                    raise openai.APITimeoutError(request=e.request) from e
+            except httpx.HTTPError as e:
+                if not retries_left:
+                    raise openai.APIConnectionError(request=e.request) from e
+            else:
+                status = response.status_code
+                if not (retries_left and (status in _RETRY_STATUSES or status >= 500)):
+                    return self._handle_fast_response(response)
+                await asyncio.sleep(_retry_delay(attempt, response))
+                continue
+
+            await asyncio.sleep(_retry_delay(attempt))
+
+    def _handle_fast_response(self, response: httpx.Response) -> LLMResponse:
+        """Parse a fast-path response, raising the SDK's typed error on failure."""
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            data = None
+
+        if response.status_code != 200:
+            error_cls = _STATUS_ERRORS.get(response.status_code)
+            if error_cls is None:
+                error_cls = openai.InternalServerError if response.status_code >= 500 else openai.APIStatusError
+            raise error_cls(
+                f"Error code: {response.status_code} - {data if data is not None else response.text}",
+                response=response,
+                body=data,
+            )
+
+        if data is None:
+            raise openai.APIResponseValidationError(response=response, body=response.text)
+        # OpenRouter can report upstream failures in a 200 body
+        if not data.get("choices"):
+            raise openai.APIError(
+                f"No choices in response: {data.get('error', data)}",
+                response.request,
+                body=data,
+            )
+
+        return parse_response_json(data)
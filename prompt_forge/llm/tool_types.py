@@ -1,29 +1,105 @@
 """Unified tool definition format for all LLM providers."""
 
+import copy
+import hashlib
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
+import orjson
 
-@dataclass
-class ToolParameter:
-    """A parameter for a tool."""
+
+class ToolParameter(NamedTuple):
+    """A parameter for a tool. Read-only, so a tuple keeps field access cheap."""
     name: str
     type: str  # "string", "array", "object", "number", "boolean"
     description: str
     required: bool = True
     items: dict[str, Any] | None = None  # For array types
     properties: dict[str, Any] | None = None  # For object types
+    constraints: dict[str, Any] | None = None  # Extra JSON Schema keywords (minLength, pattern, ...)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
-    """Unified tool definition that converts to provider-specific formats."""
+    """
+    Unified tool definition that converts to provider-specific formats.
+
+    Definitions are immutable, so each format is built once and cached.
+    Callers must not mutate the returned dicts.
+    """
     name: str
     description: str
-    parameters: list[ToolParameter] = field(default_factory=list)
+    parameters: tuple[ToolParameter, ...] = ()
+    summary: str = ""  # Short description used when the full schema is withheld
+    _anthropic_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _openai_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _fingerprint_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept any sequence of parameters
+        object.__setattr__(self, "parameters", tuple(self.parameters))
+
+    def fingerprint(self) -> str:
+        """
+        Content hash of the tool's name, description and schema.
+
+        Hashes a canonical (sorted-key) encoding of the shared schema, so
+        equal definitions match regardless of identity or format.
+        """
+        if self._fingerprint_cache is None:
+            properties, required = self._build_schema()
+            canonical = orjson.dumps(
+                [self.name, self.description, properties, required],
+                option=orjson.OPT_SORT_KEYS,
+            )
+            object.__setattr__(self, "_fingerprint_cache", hashlib.blake2b(canonical, digest_size=16).hexdigest())
+        return self._fingerprint_cache
+
+    def to_anthropic_format(self, cache_control: dict | None = None) -> dict:
+        """
+        Convert to Anthropic's tool format.
+
+        Args:
+            cache_control: Prompt-cache marker, e.g. {"type": "ephemeral"}. Set it
+                on the last tool to cache the whole tool list.
+        """
+        if self._anthropic_cache is None:
+            object.__setattr__(self, "_anthropic_cache", copy.deepcopy(self._build_anthropic_format()))
+        if cache_control:
+            return {**self._anthropic_cache, "cache_control": cache_control}
+        return self._anthropic_cache
+
+    def to_openai_format(self) -> dict:
+        """Convert to OpenAI's function calling format."""
+        if self._openai_cache is None:
+            object.__setattr__(self, "_openai_cache", copy.deepcopy(self._build_openai_format()))
+        return self._openai_cache
+
+    def to_openai_summary(self) -> dict:
+        """
+        Convert to a schema-less OpenAI function stub (name and summary only).
+
+        Used for tools the model isn't expected to call this turn; the full
+        schema is sent once the tool is selected.
+        """
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.summary or self.description,
+            }
+        }
+
+    def to_anthropic_summary(self) -> dict:
+        """Convert to a schema-less Anthropic tool stub (name and summary only)."""
+        return {
+            "name": self.name,
+            "description": self.summary or self.description,
+            "input_schema": {"type": "object"},
+        }
 
-    def to_anthropic_format(self) -> dict:
-        """Convert to Anthropic's tool format."""
+    def _build_schema(self) -> tuple[dict, list]:
+        """Build the JSON Schema properties and required list shared by all formats."""
         properties = {}
         required = []
 
@@ -36,11 +112,18 @@ class ToolDefinition:
                 prop["items"] = param.items
             if param.properties:
                 prop["properties"] = param.properties
+            if param.constraints:
+                prop.update(param.constraints)
             properties[param.name] = prop
 
             if param.required:
                 required.append(param.name)
 
+        return properties, required
+
+    def _build_anthropic_format(self) -> dict:
+        """Wrap the schema in Anthropic's tool format."""
+        properties, required = self._build_schema()
         return {
             "name": self.name,
             "description": self.description,
@@ -51,25 +134,9 @@ class ToolDefinition:
             }
         }
 
-    def to_openai_format(self) -> dict:
-        """Convert to OpenAI's function calling format."""
-        properties = {}
-        required = []
-
-        for param in self.parameters:
-            prop = {
-                "type": param.type,
-                "description": param.description,
-            }
-            if param.items:
-                prop["items"] = param.items
-            if param.properties:
-                prop["properties"] = param.properties
-            properties[param.name] = prop
-
-            if param.required:
-                required.append(param.name)
-
+    def _build_openai_format(self) -> dict:
+        """Wrap the schema in OpenAI's function calling format."""
+        properties, required = self._build_schema()
         return {
             "type": "function",
             "function": {
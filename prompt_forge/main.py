@@ -2,6 +2,7 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from models import OptimizeRequest, OptimizeResponse
 from agents import OrchestratorAgent
@@ -11,6 +12,7 @@ app = FastAPI(
     title="Prompt Forge",
     description="Agentic prompt optimization for multiple AI providers",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for future UI integration
@@ -5,10 +5,15 @@ Logs are written to: prompt_forge/logs/
 Each optimization request creates a timestamped log file.
 """
 
+import atexit
 import os
-import json
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
+
+import orjson
 
 # Log directory
 LOGS_DIR = Path(__file__).parent.parent / "logs"
@@ -27,6 +32,61 @@ def create_log_file(provider: str) -> Path:
     return LOGS_DIR / filename
 
 
+class _LogWriter:
+    """Appends queued text to a log file from a daemon thread, off the event loop."""
+
+    _CLOSE = object()
+    # Writers whose thread is still running; drained at interpreter exit
+    _live: set["_LogWriter"] = set()
+
+    def __init__(self, filepath: Path):
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, args=(filepath,), daemon=True)
+        self._live.add(self)
+        self._thread.start()
+
+    def write(self, text: str | Callable[[], str]):
+        """Queue text for writing. Callables are invoked on the writer thread."""
+        self._queue.put(text)
+
+    def close(self):
+        """
+        Stop the writer thread once everything queued so far is written.
+
+        Does not wait for the thread, so it is safe to call on the event loop.
+        """
+        self._queue.put(self._CLOSE)
+
+    def _run(self, filepath: Path):
+        try:
+            self._write_loop(filepath)
+        finally:
+            self._live.discard(self)
+
+    def _write_loop(self, filepath: Path):
+        with open(filepath, 'w') as f:
+            while True:
+                item = self._queue.get()
+                if item is self._CLOSE:
+                    break
+                # A failing entry (e.g. unserializable metadata) must not kill the writer
+                try:
+                    f.write(item() if callable(item) else item)
+                except Exception as e:
+                    f.write(f"\n[LOG WRITE ERROR] {e!r}\n")
+                # Flush once the backlog drains so the file stays readable mid-run
+                if self._queue.empty():
+                    f.flush()
+
+
+@atexit.register
+def _drain_log_writers():
+    """Let pending log writes finish before the daemon threads are killed at exit."""
+    for writer in list(_LogWriter._live):
+        writer.close()
+        writer._thread.join()
+
+
 class FileLogger:
     """
     Writes detailed agent execution logs to a file.
@@ -44,6 +104,8 @@ class FileLogger:
         self.filepath = create_log_file(provider)
         self.start_time = datetime.now()
         self.entries = []
+        self._closed = False
+        self._writer = _LogWriter(self.filepath)
         
         # Write header
         self._write_header()
@@ -60,13 +122,15 @@ Log File: {self.filepath.name}
 {'='*80}
 
 """
-        with open(self.filepath, 'w') as f:
-            f.write(header)
+        self._writer.write(header)
     
-    def log(self, event_type: str, content: str, metadata: dict = None):
+    def log(self, event_type: str, content: str | Callable[[], str], metadata: dict = None):
         """
         Log an event to the file.
         
+        Content may be a zero-argument callable for text that is expensive to
+        build (e.g. pretty-printed JSON); it is only evaluated by the writer thread.
+        
         Event types:
         - system: System messages
         - llm_input: Full input sent to LLM
@@ -82,12 +146,25 @@ Log File: {self.filepath.name}
             "timestamp": timestamp,
             "elapsed_seconds": round(elapsed, 3),
             "type": event_type,
-            "content_length": len(content),
+            "content_length": len(content) if isinstance(content, str) else None,
             "metadata": metadata or {}
         }
         self.entries.append(entry)
         
-        # Format for file
+        # Formatting happens on the writer thread
+        self._writer.write(
+            lambda: self._format(timestamp, elapsed, event_type, content, metadata)
+        )
+    
+    @staticmethod
+    def _format(
+        timestamp: str,
+        elapsed: float,
+        event_type: str,
+        content: str | Callable[[], str],
+        metadata: dict | None,
+    ) -> str:
+        """Format a log event for the file."""
         separator = "-" * 60
         
         log_text = f"""
@@ -97,13 +174,13 @@ Log File: {self.filepath.name}
 """
         
         if metadata:
-            log_text += f"Metadata: {json.dumps(metadata, indent=2)}\n\n"
+            log_text += f"Metadata: {orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode()}\n\n"
         
+        if callable(content):
+            content = content()
         log_text += f"{content}\n"
         
-        # Write to file immediately
-        with open(self.filepath, 'a') as f:
-            f.write(log_text)
+        return log_text
     
     def log_llm_messages(self, messages: list):
         """Log the full message array sent to LLM."""
@@ -117,7 +194,11 @@ Log File: {self.filepath.name}
         self.log("llm_input", full_input, {"message_count": len(messages)})
     
     def close(self, success: bool, result_summary: str = ""):
-        """Close the log file with a summary."""
+        """Close the log file with a summary. Later calls are no-ops."""
+        if self._closed:
+            return self.filepath
+        self._closed = True
+
         elapsed = (datetime.now() - self.start_time).total_seconds()
         
         summary = f"""
@@ -132,8 +213,8 @@ Events Logged: {len(self.entries)}
 {'='*80}
 """
         
-        with open(self.filepath, 'a') as f:
-            f.write(summary)
+        self._writer.write(summary)
+        self._writer.close()
         
         print(f"[PROMPT_FORGE] Agent log saved: {self.filepath}")
         return self.filepath